@@ -0,0 +1,29 @@
+"""
+Numba Compatibility
+
+Optional Numba JIT support for numeric kernels. When numba is not installed,
+``njit`` is a no-op decorator and ``prange`` falls back to ``range`` so the
+kernels run as plain Python.
+
+Kernels are compiled with ``cache=True``; set ``NUMBA_CACHE_DIR`` to a
+writable location when the package directory is read-only.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
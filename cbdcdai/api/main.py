@@ -5,11 +5,24 @@ FastAPI application providing REST API endpoints for CBDC simulation,
 risk analytics, and regulatory compliance monitoring.
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict, List, Optional
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, conlist
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import orjson
+import pandas as pd
 import uvicorn
 
+from ..config.settings import get_settings
 from ..simulation.cbdc_simulator import CBDCSimulator, CBDCParameters, EconomicIndicators
 from ..risk.risk_analytics import RiskAnalytics, RiskMetrics
 from ..compliance.regulatory_compliance import (
@@ -19,26 +32,101 @@ from ..compliance.regulatory_compliance import (
     ComplianceRequirement
 )
 
+# Process pool for CPU-bound work, created lazily and rebuilt if it breaks
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Process pool for CPU-bound simulation and analytics work, so heavy
+    requests run in parallel without blocking the event loop
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=_pool_size(),
+            initializer=_init_worker
+        )
+    return _process_pool
+
+def _pool_size() -> int:
+    """
+    Pool processes per web worker, splitting the CPUs across the uvicorn
+    workers so the host is not oversubscribed
+    """
+    settings = get_settings()
+    if settings.PROCESS_POOL_WORKERS:
+        return settings.PROCESS_POOL_WORKERS
+    web_workers = 1 if settings.DEBUG else settings.WEB_CONCURRENCY
+    return max(1, (os.cpu_count() or 1) // max(1, web_workers))
+
+def _init_worker() -> None:
+    """
+    Drop engines inherited from the parent on fork, so each worker builds
+    its own and the simulator RNG draws fresh entropy per process
+    """
+    get_simulator.cache_clear()
+    get_risk_engine.cache_clear()
+    get_compliance_engine.cache_clear()
+
+def _reset_process_pool(pool: Optional[ProcessPoolExecutor] = None) -> None:
+    """
+    Shut down the process pool so the next request builds a fresh one
+    
+    Args:
+        pool: Only reset if this is still the current pool (None resets any)
+    """
+    global _process_pool
+    if _process_pool is not None and (pool is None or pool is _process_pool):
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, including NumPy scalars and arrays"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Shut down the process pool with the application"""
+    yield
+    _reset_process_pool()
+
 app = FastAPI(
     title="CBDCDAI API",
     description="Central Bank Digital Currency & Digital Assets Infrastructure API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Initialize core components
-simulator = CBDCSimulator(
-    CBDCParameters(
-        interest_rate=0.02,
-        reserve_requirement=0.1,
-        transaction_limit=1000000,
-        holding_limit=10000000,
-        privacy_level=0.7,
-        cross_border_enabled=True
+# Core components, created lazily on first request
+@lru_cache(maxsize=1)
+def get_simulator() -> CBDCSimulator:
+    """Return the shared CBDC simulator"""
+    return CBDCSimulator(
+        CBDCParameters(
+            interest_rate=0.02,
+            reserve_requirement=0.1,
+            transaction_limit=1000000,
+            holding_limit=10000000,
+            privacy_level=0.7,
+            cross_border_enabled=True
+        )
     )
-)
 
-risk_engine = RiskAnalytics()
-compliance_engine = RegulatoryCompliance()
+@lru_cache(maxsize=1)
+def get_risk_engine() -> RiskAnalytics:
+    """Return the shared risk analytics engine"""
+    return RiskAnalytics()
+
+@lru_cache(maxsize=1)
+def get_compliance_engine() -> RegulatoryCompliance:
+    """Return the shared regulatory compliance engine"""
+    return RegulatoryCompliance()
+
+# Constant response payloads
+_JURISDICTIONS_PAYLOAD = tuple(jurisdiction.value for jurisdiction in Jurisdiction)
 
 # API Models
 class SimulationRequest(BaseModel):
@@ -52,7 +140,7 @@ class CrossBorderRequest(BaseModel):
     exchange_rate: float
 
 class RiskAssessmentRequest(BaseModel):
-    returns: List[float]
+    returns: conlist(float, max_length=100_000)
     trading_metrics: Dict
     operational_metrics: Dict
     systemic_metrics: Dict
@@ -63,6 +151,102 @@ class ComplianceRequest(BaseModel):
     kyc_data: Dict
     aml_data: Dict
 
+async def _run_in_pool(func: Callable, *args) -> Any:
+    """Run a CPU-bound module-level callable in the process pool"""
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A worker died; replace the pool and retry once
+        _reset_process_pool(pool)
+        return await loop.run_in_executor(get_process_pool(), func, *args)
+
+def _call_with_engine(factory: Callable, func: Callable, *args) -> Any:
+    """Call func with the worker process's own engine from factory"""
+    return func(factory(), *args)
+
+async def _run_engine(engine: Any, factory: Callable, func: Callable, *args) -> Any:
+    """
+    Run func(engine, *args) off the event loop
+    
+    The default engine is never pickled: the pool worker calls func on its
+    own per-process engine from factory. Engines substituted through
+    app.dependency_overrides run in a worker thread instead.
+    
+    Args:
+        engine: Engine resolved by the endpoint dependency
+        factory: Module-level factory of the default engine
+        func: Module-level function or unbound method taking the engine first
+        *args: Remaining arguments for func
+        
+    Returns:
+        Result of func
+    """
+    if engine is factory():
+        return await _run_in_pool(_call_with_engine, factory, func, *args)
+    return await asyncio.to_thread(func, engine, *args)
+
+def _columnar_payload(df: pd.DataFrame) -> Dict:
+    """Columnar payload for a results DataFrame, avoiding per-row dicts"""
+    return {
+        "columns": df.columns.tolist(),
+        "data": np.ascontiguousarray(df.to_numpy())
+    }
+
+def _monetary_transmission_payload(simulator: CBDCSimulator,
+                                   policy_rate_change: float,
+                                   simulation_periods: int) -> bytes:
+    """Serialized monetary transmission results"""
+    results = simulator.simulate_monetary_transmission(
+        policy_rate_change,
+        simulation_periods
+    )
+    return orjson.dumps(_columnar_payload(results), option=orjson.OPT_SERIALIZE_NUMPY)
+
+# Monetary transmission payloads of the default simulator, memoized in the
+# event-loop process so repeated requests skip the pool entirely. Bounded by
+# entry count and total payload bytes, since long horizons give large bodies.
+_TRANSMISSION_CACHE_SIZE = 1024
+_TRANSMISSION_CACHE_BYTES = 64 * 1024 * 1024
+_transmission_cache: "OrderedDict[Tuple[float, int], bytes]" = OrderedDict()
+_transmission_cache_bytes = 0
+
+def _cached_transmission_payload(key: Tuple[float, int]) -> Optional[bytes]:
+    """Look up a memoized payload, marking it recently used"""
+    payload = _transmission_cache.get(key)
+    if payload is not None:
+        _transmission_cache.move_to_end(key)
+    return payload
+
+def _cache_transmission_payload(key: Tuple[float, int], payload: bytes) -> None:
+    """Memoize a payload, evicting the least recently used while over budget"""
+    global _transmission_cache_bytes
+    if len(payload) > _TRANSMISSION_CACHE_BYTES:
+        return
+    previous = _transmission_cache.pop(key, None)
+    if previous is not None:
+        _transmission_cache_bytes -= len(previous)
+    _transmission_cache[key] = payload
+    _transmission_cache_bytes += len(payload)
+    while (len(_transmission_cache) > _TRANSMISSION_CACHE_SIZE or
+           _transmission_cache_bytes > _TRANSMISSION_CACHE_BYTES):
+        _, evicted = _transmission_cache.popitem(last=False)
+        _transmission_cache_bytes -= len(evicted)
+
+# Rows per orjson chunk when streaming large results
+_STREAM_CHUNK_ROWS = 1024
+
+def _stream_columnar_payload(df: pd.DataFrame) -> Iterator[bytes]:
+    """Stream the columnar payload for a results DataFrame in row chunks"""
+    values = df.to_numpy()
+    yield b'{"columns":' + orjson.dumps(df.columns.tolist()) + b',"data":['
+    for start in range(0, len(values), _STREAM_CHUNK_ROWS):
+        chunk = np.ascontiguousarray(values[start:start + _STREAM_CHUNK_ROWS])
+        rows = orjson.dumps(chunk, option=orjson.OPT_SERIALIZE_NUMPY)[1:-1]
+        yield rows if start == 0 else b"," + rows
+    yield b"]}"
+
 # API Routes
 @app.get("/")
 async def root():
@@ -74,22 +258,35 @@ async def root():
     }
 
 @app.post("/simulation/monetary-transmission")
-async def simulate_monetary_transmission(request: SimulationRequest):
+async def simulate_monetary_transmission(request: SimulationRequest,
+                                         simulator: CBDCSimulator = Depends(get_simulator)):
     """Simulate monetary policy transmission"""
     try:
-        results = simulator.simulate_monetary_transmission(
-            request.policy_rate_change,
-            request.simulation_periods
-        )
-        return results.to_dict(orient="records")
+        key = (request.policy_rate_change, request.simulation_periods)
+        cacheable = simulator is get_simulator()
+        payload = _cached_transmission_payload(key) if cacheable else None
+        if payload is None:
+            payload = await _run_engine(
+                simulator,
+                get_simulator,
+                _monetary_transmission_payload,
+                *key
+            )
+            if cacheable:
+                _cache_transmission_payload(key, payload)
+        return Response(payload, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/simulation/cross-border")
-async def simulate_cross_border(request: CrossBorderRequest):
+async def simulate_cross_border(request: CrossBorderRequest,
+                                simulator: CBDCSimulator = Depends(get_simulator)):
     """Simulate cross-border payment"""
     try:
-        results = simulator.simulate_cross_border_payment(
+        results = await _run_engine(
+            simulator,
+            get_simulator,
+            CBDCSimulator.simulate_cross_border_payment,
             request.amount,
             request.source_currency,
             request.target_currency,
@@ -100,48 +297,72 @@ async def simulate_cross_border(request: CrossBorderRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/simulation/financial-stability")
-async def simulate_financial_stability(request: SimulationRequest):
+async def simulate_financial_stability(request: SimulationRequest,
+                                       simulator: CBDCSimulator = Depends(get_simulator)):
     """Simulate financial stability impacts"""
     try:
-        results = simulator.simulate_financial_stability(
+        results = await _run_engine(
+            simulator,
+            get_simulator,
+            CBDCSimulator.simulate_financial_stability,
             request.simulation_periods
         )
-        return results.to_dict(orient="records")
+        return StreamingResponse(
+            _stream_columnar_payload(results),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/risk/assessment")
-async def assess_risk(request: RiskAssessmentRequest):
+async def assess_risk(request: RiskAssessmentRequest,
+                      risk_engine: RiskAnalytics = Depends(get_risk_engine)):
     """Generate comprehensive risk assessment"""
     try:
-        results = risk_engine.generate_risk_report(
+        results = await _run_engine(
+            risk_engine,
+            get_risk_engine,
+            RiskAnalytics.generate_risk_report,
             request.returns,
             request.trading_metrics,
             request.operational_metrics,
             request.systemic_metrics
         )
-        return results.dict()
+        return results.model_dump()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/compliance/assessment")
-async def assess_compliance(request: ComplianceRequest):
+async def assess_compliance(request: ComplianceRequest,
+                            compliance_engine: RegulatoryCompliance = Depends(get_compliance_engine)):
     """Generate compliance assessment"""
     try:
-        results = compliance_engine.generate_compliance_report(
+        results = await _run_engine(
+            compliance_engine,
+            get_compliance_engine,
+            RegulatoryCompliance.generate_compliance_report,
             request.reserve_data,
             request.transaction_data,
             request.kyc_data,
             request.aml_data
         )
-        return results.dict()
+        return results.model_dump()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/compliance/jurisdictions")
 async def get_jurisdictions():
     """Get supported jurisdictions"""
-    return [jurisdiction.value for jurisdiction in Jurisdiction]
+    return _JURISDICTIONS_PAYLOAD
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    settings = get_settings()
+    uvicorn.run(
+        "cbdcdai.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=1 if settings.DEBUG else settings.WEB_CONCURRENCY,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=settings.DEBUG
+    ) 
\ No newline at end of file
@@ -9,10 +9,15 @@ and regulatory change management.
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 
+from .._numba import njit, prange
+
+_UTC = timezone.utc
+_ONE_DAY = timedelta(days=1)
+
 class RegulatoryFramework(str, Enum):
     """Supported regulatory frameworks"""
     MICA = "MICA"  # EU Markets in Crypto-Assets
@@ -21,7 +26,45 @@ class RegulatoryFramework(str, Enum):
     BIS = "BIS"  # Bank for International Settlements
     FATF = "FATF"  # Financial Action Task Force
 
-class ComplianceRequirement(BaseModel):
+# Risk score weights per framework; unknown frameworks use the FATF weight
+_FRAMEWORK_IDX = {
+    RegulatoryFramework.MICA: 0,
+    RegulatoryFramework.GENIUS: 1,
+    RegulatoryFramework.FSB: 2,
+    RegulatoryFramework.BIS: 3,
+    RegulatoryFramework.FATF: 4
+}
+_FRAMEWORK_WEIGHT = np.array([0.3, 0.3, 0.2, 0.1, 0.1])
+
+# Compliance rules as (predicate, violation, corrective action) tuples
+_MICA_RULES = (
+    (lambda d: d['reserve_data']['ratio'] < 1.0,
+     "Insufficient reserves", "Increase reserve holdings"),
+    (lambda d: d['transaction_data']['amount'] > 1000000,  # €1M limit
+     "Transaction limit exceeded", "Implement transaction limits")
+)
+
+_GENIUS_RULES = (
+    (lambda d: d['stablecoin_data']['reserve_ratio'] < 1.0,
+     "Insufficient reserves", "Increase reserve holdings"),
+    (lambda d: d['kyc_data']['completion_rate'] < 0.95,
+     "Incomplete KYC", "Complete KYC for all users")
+)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _mica_batch_kernel(reserve_ratio, transaction_amount):
+    """MiCA compliance scores and status for arrays of records"""
+    n = reserve_ratio.shape[0]
+    scores = np.empty(n)
+    status = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        violations = int(reserve_ratio[i] < 1.0) + int(transaction_amount[i] > 1000000.0)
+        scores[i] = 1.0 - violations * 0.2
+        status[i] = scores[i] >= 0.8
+    return scores, status
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ComplianceRequirement:
     """Detailed compliance requirement"""
     framework: RegulatoryFramework
     requirement_id: str
@@ -30,11 +73,16 @@ class ComplianceRequirement(BaseModel):
     monitoring_frequency: str
     reporting_frequency: str
     effective_date: datetime
-    expiry_date: Optional[datetime]
+    expiry_date: Optional[datetime] = None
     jurisdiction: str
     category: str
+    
+    def dict(self) -> Dict:
+        """Return the requirement as a dictionary"""
+        return asdict(self)
 
-class ComplianceMetrics(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ComplianceMetrics:
     """Detailed compliance metrics"""
     framework: RegulatoryFramework
     requirement_id: str
@@ -44,6 +92,10 @@ class ComplianceMetrics(BaseModel):
     violations: List[str]
     corrective_actions: List[str]
     status: str
+    
+    def dict(self) -> Dict:
+        """Return the metrics as a dictionary"""
+        return asdict(self)
 
 class AdvancedCompliance:
     """Advanced compliance monitoring engine"""
@@ -60,53 +112,87 @@ class AdvancedCompliance:
         
     def check_mica_compliance(self,
                             reserve_data: Dict,
-                            transaction_data: Dict) -> ComplianceMetrics:
+                            transaction_data: Dict,
+                            now: Optional[datetime] = None) -> ComplianceMetrics:
         """
         Check MiCA compliance
         
         Args:
             reserve_data: Reserve adequacy data
             transaction_data: Transaction data
+            now: Check timestamp (defaults to the current UTC time)
             
         Returns:
             ComplianceMetrics object
         """
-        violations = []
-        corrective_actions = []
-        
-        # Check reserve requirements
-        if reserve_data['ratio'] < 1.0:
-            violations.append("Insufficient reserves")
-            corrective_actions.append("Increase reserve holdings")
-        
-        # Check transaction limits
-        if transaction_data['amount'] > 1000000:  # €1M limit
-            violations.append("Transaction limit exceeded")
-            corrective_actions.append("Implement transaction limits")
+        return self._check_rules(
+            RegulatoryFramework.MICA,
+            "MICA_001",
+            {'reserve_data': reserve_data, 'transaction_data': transaction_data},
+            _MICA_RULES,
+            now
+        )
+    
+    def check_mica_compliance_batch(self,
+                                  reserve_ratio: np.ndarray,
+                                  transaction_amount: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check MiCA compliance for a batch of records
         
-        # Calculate compliance score
-        compliance_score = 1.0 - (len(violations) * 0.2)
+        Applies the same rules as check_mica_compliance without building a
+        ComplianceMetrics object per record; call check_mica_compliance for
+        the non-compliant rows that need detailed violations.
         
-        return ComplianceMetrics(
-            framework=RegulatoryFramework.MICA,
-            requirement_id="MICA_001",
-            compliance_score=compliance_score,
-            last_check=datetime.now(),
-            next_check=datetime.now() + timedelta(days=1),
-            violations=violations,
-            corrective_actions=corrective_actions,
-            status="Compliant" if compliance_score >= 0.8 else "Non-compliant"
+        Args:
+            reserve_ratio: Array of reserve ratios
+            transaction_amount: Array of transaction amounts
+            
+        Returns:
+            Tuple of (compliance scores, compliant status) arrays
+        """
+        return _mica_batch_kernel(
+            np.asarray(reserve_ratio, dtype=np.float64),
+            np.asarray(transaction_amount, dtype=np.float64)
         )
     
     def check_genius_compliance(self,
                               stablecoin_data: Dict,
-                              kyc_data: Dict) -> ComplianceMetrics:
+                              kyc_data: Dict,
+                              now: Optional[datetime] = None) -> ComplianceMetrics:
         """
         Check GENIUS Act compliance
         
         Args:
             stablecoin_data: Stablecoin data
             kyc_data: KYC data
+            now: Check timestamp (defaults to the current UTC time)
+            
+        Returns:
+            ComplianceMetrics object
+        """
+        return self._check_rules(
+            RegulatoryFramework.GENIUS,
+            "GENIUS_001",
+            {'stablecoin_data': stablecoin_data, 'kyc_data': kyc_data},
+            _GENIUS_RULES,
+            now
+        )
+    
+    def _check_rules(self,
+                   framework: RegulatoryFramework,
+                   requirement_id: str,
+                   data: Dict,
+                   rules: Tuple,
+                   now: Optional[datetime]) -> ComplianceMetrics:
+        """
+        Evaluate a rule table against compliance data
+        
+        Args:
+            framework: Regulatory framework being checked
+            requirement_id: Requirement identifier
+            data: Input data passed to each rule predicate
+            rules: Tuple of (predicate, violation, corrective action) rules
+            now: Check timestamp (defaults to the current UTC time)
             
         Returns:
             ComplianceMetrics object
@@ -114,25 +200,21 @@ class AdvancedCompliance:
         violations = []
         corrective_actions = []
         
-        # Check reserve requirements
-        if stablecoin_data['reserve_ratio'] < 1.0:
-            violations.append("Insufficient reserves")
-            corrective_actions.append("Increase reserve holdings")
-        
-        # Check KYC requirements
-        if kyc_data['completion_rate'] < 0.95:
-            violations.append("Incomplete KYC")
-            corrective_actions.append("Complete KYC for all users")
+        for predicate, violation, corrective_action in rules:
+            if predicate(data):
+                violations.append(violation)
+                corrective_actions.append(corrective_action)
         
         # Calculate compliance score
         compliance_score = 1.0 - (len(violations) * 0.2)
+        now = now or datetime.now(_UTC)
         
         return ComplianceMetrics(
-            framework=RegulatoryFramework.GENIUS,
-            requirement_id="GENIUS_001",
+            framework=framework,
+            requirement_id=requirement_id,
             compliance_score=compliance_score,
-            last_check=datetime.now(),
-            next_check=datetime.now() + timedelta(days=1),
+            last_check=now,
+            next_check=now + _ONE_DAY,
             violations=violations,
             corrective_actions=corrective_actions,
             status="Compliant" if compliance_score >= 0.8 else "Non-compliant"
@@ -186,35 +268,36 @@ class AdvancedCompliance:
         
         # Check for new requirements
         for req_id, req in new_dict.items():
-            if req_id not in current_dict:
+            if req_id in current_dict:
+                continue
+            changes.append({
+                'type': 'new',
+                'requirement_id': req_id,
+                'description': req.description,
+                'effective_date': req.effective_date
+            })
+        
+        # Check for modified requirements
+        for req_id, req in new_dict.items():
+            current_req = current_dict.get(req_id)
+            if current_req is not None and req.threshold != current_req.threshold:
                 changes.append({
-                    'type': 'new',
+                    'type': 'modified',
                     'requirement_id': req_id,
-                    'description': req.description,
+                    'old_threshold': current_req.threshold,
+                    'new_threshold': req.threshold,
                     'effective_date': req.effective_date
                 })
         
-        # Check for modified requirements
-        for req_id, req in new_dict.items():
-            if req_id in current_dict:
-                current_req = current_dict[req_id]
-                if req.threshold != current_req.threshold:
-                    changes.append({
-                        'type': 'modified',
-                        'requirement_id': req_id,
-                        'old_threshold': current_req.threshold,
-                        'new_threshold': req.threshold,
-                        'effective_date': req.effective_date
-                    })
-        
         # Check for removed requirements
         for req_id, req in current_dict.items():
-            if req_id not in new_dict:
-                changes.append({
-                    'type': 'removed',
-                    'requirement_id': req_id,
-                    'description': req.description
-                })
+            if req_id in new_dict:
+                continue
+            changes.append({
+                'type': 'removed',
+                'requirement_id': req_id,
+                'description': req.description
+            })
         
         return changes
     
@@ -233,20 +316,19 @@ class AdvancedCompliance:
             return 1.0
         
         # Calculate weighted average of compliance scores
-        weights = {
-            RegulatoryFramework.MICA: 0.3,
-            RegulatoryFramework.GENIUS: 0.3,
-            RegulatoryFramework.FSB: 0.2,
-            RegulatoryFramework.BIS: 0.1,
-            RegulatoryFramework.FATF: 0.1
-        }
-        
-        weighted_scores = [
-            metric.compliance_score * weights.get(metric.framework, 0.1)
-            for metric in metrics
-        ]
+        count = len(metrics)
+        idx = np.fromiter(
+            (_FRAMEWORK_IDX.get(metric.framework, 4) for metric in metrics),
+            dtype=np.int8,
+            count=count
+        )
+        scores = np.fromiter(
+            (metric.compliance_score for metric in metrics),
+            dtype=np.float64,
+            count=count
+        )
         
-        return 1.0 - sum(weighted_scores)
+        return 1.0 - float(scores @ _FRAMEWORK_WEIGHT[idx])
 
 # Example usage
 if __name__ == "__main__":
@@ -261,7 +343,7 @@ if __name__ == "__main__":
         threshold=1.0,
         monitoring_frequency="daily",
         reporting_frequency="monthly",
-        effective_date=datetime.now(),
+        effective_date=datetime.now(_UTC),
         jurisdiction="EU",
         category="Reserves"
     )
@@ -273,7 +355,7 @@ if __name__ == "__main__":
         threshold=0.95,
         monitoring_frequency="daily",
         reporting_frequency="monthly",
-        effective_date=datetime.now(),
+        effective_date=datetime.now(_UTC),
         jurisdiction="US",
         category="KYC"
     )
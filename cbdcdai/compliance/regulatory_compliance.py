@@ -12,6 +12,8 @@ from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from .._numba import njit, prange
+
 class Jurisdiction(str, Enum):
     """Supported jurisdictions"""
     US = "US"
@@ -21,6 +23,45 @@ class Jurisdiction(str, Enum):
     JAPAN = "JAPAN"
     SINGAPORE = "SINGAPORE"
 
+# Jurisdiction parameters, one record per jurisdiction in enum order
+_PARAMS = np.array([
+    (1.0, 1000000),  # US: 100% reserve requirement, $1M limit
+    (1.0, 1000000),  # EU: 100% reserve requirement, €1M limit
+    (1.0, 1000000),  # UK: 100% reserve requirement, £1M limit
+    (1.0, 1000000),  # CHINA: 100% reserve requirement, ¥1M limit
+    (1.0, 1000000),  # JAPAN: 100% reserve requirement, ¥1M limit
+    (1.0, 1000000)  # SINGAPORE: 100% reserve requirement, S$1M limit
+], dtype=[('reserve', 'f8'), ('tx_limit', 'f8')])
+
+# Integer jurisdiction codes and contiguous per-parameter arrays for
+# vectorized lookups
+_JURIS_INDEX: Dict[Jurisdiction, int] = {j: i for i, j in enumerate(Jurisdiction)}
+_JURIS_NAMES = tuple(j.value for j in Jurisdiction)
+_RESERVE_ARR = np.ascontiguousarray(_PARAMS['reserve'])
+_LIMITS_ARR = np.ascontiguousarray(_PARAMS['tx_limit'])
+
+@njit(cache=True, fastmath=True)
+def _reserve_ratio(total_liabilities, reserve_assets, required_ratio):
+    """Reserve adequacy ratio capped at full compliance"""
+    actual_ratio = reserve_assets / total_liabilities
+    return min(actual_ratio / required_ratio, 1.0)
+
+@njit(cache=True, fastmath=True)
+def _aml_score(transaction_volume, suspicious_transactions, risk_score):
+    """AML compliance score clipped to [0, 1]"""
+    suspicious_ratio = suspicious_transactions / transaction_volume if transaction_volume > 0 else 0.0
+    compliance_score = 1.0 - (0.4 * suspicious_ratio + 0.6 * risk_score)
+    return max(min(compliance_score, 1.0), 0.0)
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _aml_score_vec(transaction_volume, suspicious_transactions, risk_score):
+    """Element-wise AML compliance scores for a batch of records"""
+    n = transaction_volume.shape[0]
+    scores = np.empty(n)
+    for i in prange(n):
+        scores[i] = _aml_score(transaction_volume[i], suspicious_transactions[i], risk_score[i])
+    return scores
+
 class ComplianceRequirement(BaseModel):
     """Compliance requirement definition"""
     jurisdiction: Jurisdiction
@@ -65,20 +106,9 @@ class RegulatoryCompliance:
         Returns:
             Reserve adequacy ratio
         """
-        # Jurisdiction-specific requirements
-        requirements = {
-            Jurisdiction.US: 1.0,  # 100% reserve requirement
-            Jurisdiction.EU: 1.0,  # 100% reserve requirement
-            Jurisdiction.UK: 1.0,  # 100% reserve requirement
-            Jurisdiction.CHINA: 1.0,  # 100% reserve requirement
-            Jurisdiction.JAPAN: 1.0,  # 100% reserve requirement
-            Jurisdiction.SINGAPORE: 1.0  # 100% reserve requirement
-        }
-        
-        required_ratio = requirements.get(jurisdiction, 1.0)
-        actual_ratio = reserve_assets / total_liabilities
-        
-        return min(actual_ratio / required_ratio, 1.0)
+        code = _JURIS_INDEX.get(jurisdiction)
+        required_ratio = _RESERVE_ARR[code] if code is not None else 1.0
+        return _reserve_ratio(float(total_liabilities), float(reserve_assets), float(required_ratio))
     
     def check_transaction_limits(self,
                                transaction_amount: float,
@@ -93,17 +123,37 @@ class RegulatoryCompliance:
         Returns:
             Compliance status
         """
-        # Jurisdiction-specific limits
-        limits = {
-            Jurisdiction.US: 1000000,  # $1M limit
-            Jurisdiction.EU: 1000000,  # €1M limit
-            Jurisdiction.UK: 1000000,  # £1M limit
-            Jurisdiction.CHINA: 1000000,  # ¥1M limit
-            Jurisdiction.JAPAN: 1000000,  # ¥1M limit
-            Jurisdiction.SINGAPORE: 1000000  # S$1M limit
-        }
+        code = _JURIS_INDEX.get(jurisdiction)
+        limit = float(_LIMITS_ARR[code]) if code is not None else float('inf')
+        return transaction_amount <= limit
+    
+    def check_transaction_limits_batch(self,
+                                     transaction_amounts: np.ndarray,
+                                     jurisdictions: Optional[List[Jurisdiction]] = None) -> np.ndarray:
+        """
+        Check transaction limit compliance for a batch of transactions
         
-        return transaction_amount <= limits.get(jurisdiction, float('inf'))
+        Args:
+            transaction_amounts: Array of transaction amounts, shape (N,)
+            jurisdictions: Jurisdiction of each transaction (optional)
+            
+        Returns:
+            Boolean array of shape (N,) with the compliance status of each
+            transaction in its jurisdiction, or of shape
+            (N, len(Jurisdiction)) against every jurisdiction when no
+            jurisdictions are given
+        """
+        amounts = np.asarray(transaction_amounts, dtype=np.float64)
+        if jurisdictions is None:
+            return amounts[:, np.newaxis] <= _LIMITS_ARR
+        
+        # Unknown jurisdictions (code -1) have no limit, as in the scalar check
+        codes = np.fromiter(
+            (_JURIS_INDEX.get(jurisdiction, -1) for jurisdiction in jurisdictions),
+            dtype=np.intp,
+            count=len(jurisdictions)
+        )
+        return amounts <= np.where(codes >= 0, _LIMITS_ARR[codes], np.inf)
     
     def assess_kyc_compliance(self,
                             total_users: int,
@@ -135,12 +185,28 @@ class RegulatoryCompliance:
         Returns:
             AML compliance score
         """
-        # Calculate suspicious transaction ratio
-        suspicious_ratio = suspicious_transactions / transaction_volume if transaction_volume > 0 else 0
+        return _aml_score(float(transaction_volume), float(suspicious_transactions), float(risk_score))
+    
+    def assess_aml_compliance_batch(self,
+                                  transaction_volume: np.ndarray,
+                                  suspicious_transactions: np.ndarray,
+                                  risk_score: np.ndarray) -> np.ndarray:
+        """
+        Assess AML compliance for a batch of records
         
-        # Calculate compliance score
-        compliance_score = 1.0 - (0.4 * suspicious_ratio + 0.6 * risk_score)
-        return max(min(compliance_score, 1.0), 0.0)
+        Args:
+            transaction_volume: Array of total transaction volumes
+            suspicious_transactions: Array of suspicious transaction counts
+            risk_score: Array of overall risk scores
+            
+        Returns:
+            Array of AML compliance scores
+        """
+        return _aml_score_vec(
+            np.asarray(transaction_volume, dtype=np.float64),
+            np.asarray(suspicious_transactions, dtype=np.float64),
+            np.asarray(risk_score, dtype=np.float64)
+        )
     
     def generate_compliance_report(self,
                                  reserve_data: Dict,
@@ -167,13 +233,8 @@ class RegulatoryCompliance:
         )
         
         # Check transaction limits
-        transaction_limits = {
-            jurisdiction: self.check_transaction_limits(
-                transaction_data['amount'],
-                jurisdiction
-            )
-            for jurisdiction in Jurisdiction
-        }
+        mask = transaction_data['amount'] <= _LIMITS_ARR
+        transaction_limits = dict(zip(_JURIS_NAMES, mask.tolist()))
         
         # Assess KYC compliance
         kyc_completion = self.assess_kyc_compliance(
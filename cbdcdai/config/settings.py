@@ -5,21 +5,33 @@ This module manages configuration settings and environment variables for the CBD
 """
 
 import os
-from typing import Dict, Any
-from pydantic import BaseSettings
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
+# Skip the .env file when the environment is already provisioned
+# (e.g. container deployments)
+_SKIP_DOTENV = bool(os.getenv("CBDCDAI_SKIP_DOTENV"))
+
 # Load environment variables from .env file
-load_dotenv()
+if os.path.exists(".env") and not _SKIP_DOTENV:
+    load_dotenv()
 
 class Settings(BaseSettings):
     """Application settings"""
     
+    # .env may hold unrelated variables (e.g. NUMBA_CACHE_DIR)
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
+    
     # API Settings
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "CBDCDAI"
     VERSION: str = "1.0.0"
     DESCRIPTION: str = "Central Bank Digital Currency & Digital Assets Infrastructure"
+    DEBUG: bool = False
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))  # Uvicorn worker processes
+    PROCESS_POOL_WORKERS: Optional[int] = None  # Pool size per web worker; default CPUs / web workers
     
     # Security Settings
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here")
@@ -51,13 +63,17 @@ class Settings(BaseSettings):
     # Monitoring Settings
     MONITORING_INTERVAL: int = 60  # seconds
     ALERT_THRESHOLD: float = 0.8
-    
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
 
-# Create settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached settings instance, created on first use"""
+    return Settings(_env_file=None) if _SKIP_DOTENV else Settings()
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level settings instance lazily"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Export settings
-__all__ = ["settings"] 
\ No newline at end of file
+__all__ = ["settings", "get_settings"] 
\ No newline at end of file
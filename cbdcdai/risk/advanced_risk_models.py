@@ -8,11 +8,31 @@ Enhanced risk assessment models for CBDC operations, including:
 - Systemic risk analysis
 """
 
+import hashlib
+import os
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from joblib import Parallel, delayed
 from pydantic import BaseModel, Field
-from scipy import stats
+from scipy import sparse, stats
+
+from .risk_analytics import _clip01, _clip01_arr
+
+# Network size from which triangles are counted via eigenvalues
+_EIGVALSH_MIN_NODES = 256
+
+# Dense networks at least this large and below this density are handled as sparse
+_SPARSE_MIN_NODES = 256
+_SPARSE_MAX_DENSITY = 0.1
+
+# Number of network topologies whose metrics are memoized per model
+_NETWORK_CACHE_SIZE = 32
+
+# Fewer missing networks than this are computed serially, skipping joblib dispatch
+_PARALLEL_MIN_NETWORKS = 4
 
 class NetworkMetrics(BaseModel):
     """Network risk metrics"""
@@ -22,6 +42,15 @@ class NetworkMetrics(BaseModel):
     clustering_coefficient: float = Field(..., description="Network clustering coefficient")
     centralization: float = Field(..., description="Network centralization")
 
+@dataclass(slots=True, frozen=True)
+class _NetworkMetricsFast:
+    """Unvalidated network metrics for internal compute paths"""
+    node_count: int
+    edge_count: int
+    average_degree: float
+    clustering_coefficient: float
+    centralization: float
+
 class LiquidityMetrics(BaseModel):
     """Liquidity risk metrics"""
     trading_volume: float = Field(..., description="Daily trading volume")
@@ -33,42 +62,162 @@ class LiquidityMetrics(BaseModel):
 class AdvancedRiskModels:
     """Advanced risk assessment models"""
     
+    # Network risk weights for centralization, (1 - clustering) and degree ratio
+    _NET_W = (0.3, 0.3, 0.4)
+    
+    # Liquidity risk weights for (1 - liquidity ratio), spread and (1 - turnover)
+    _LIQ_W = (0.4, 0.3, 0.3)
+    
+    # Systemic risk weights for network, liquidity and operational components
+    _SYS_W = (0.4, 0.3, 0.3)
+    
+    # Conditions read by the stress test risk calculations
+    _STRESS_KEYS = (
+        'volume',
+        'market_cap',
+        'spread',
+        'uptime',
+        'response_time',
+        'target_response_time',
+        'security_incidents',
+        'total_incidents'
+    )
+    
+    # Array copies of the weights for the stress test matvecs
+    _NET_W_ARR = np.array(_NET_W)
+    _LIQ_W_ARR = np.array(_LIQ_W)
+    _SYS_W_ARR = np.array(_SYS_W)
+    
     def __init__(self):
         self.network_metrics = {}
         self.liquidity_metrics = {}
+        self._factor_keys = []
+        self._chol = None
+        self._cond_keys = []
+        self._cond_idx = {}
+        self._network_cache = OrderedDict()
+        
+    def invalidate_cache(self) -> None:
+        """Clear the memoized network metrics"""
+        self._network_cache.clear()
         
+    def set_factor_covariance(self,
+                              factors: List[str],
+                              covariance: np.ndarray) -> None:
+        """
+        Set the covariance of the stress test risk factors
+        
+        Args:
+            factors: Condition keys driven by the primary shocks
+            covariance: Factor covariance matrix, ordered like factors
+        """
+        covariance = np.asarray(covariance, dtype=np.float64)
+        if covariance.shape != (len(factors), len(factors)):
+            raise ValueError("Covariance shape does not match factors")
+        self._factor_keys = list(factors)
+        self._chol = np.linalg.cholesky(covariance)
+    
     def calculate_network_risk(self,
                              adjacency_matrix: np.ndarray) -> NetworkMetrics:
         """
         Calculate network risk metrics
         
         Args:
-            adjacency_matrix: Network adjacency matrix
+            adjacency_matrix: Network adjacency matrix, dense or scipy.sparse
             
         Returns:
             NetworkMetrics object
         """
+        adjacency_matrix = self._as_network(adjacency_matrix)
+        key = self._network_key(adjacency_matrix)
+        network_metrics = self._cached_network_metrics(key)
+        if network_metrics is None:
+            network_metrics = self._network_metrics(adjacency_matrix)
+            self._cache_network_metrics(key, network_metrics)
+        return NetworkMetrics(**asdict(network_metrics))
+    
+    @staticmethod
+    def _as_network(adjacency_matrix):
+        """Keep scipy.sparse matrices, convert anything else (e.g. nested lists) to float32"""
+        if sparse.issparse(adjacency_matrix):
+            return adjacency_matrix
+        return np.asarray(adjacency_matrix, dtype=np.float32)
+    
+    @staticmethod
+    def _network_key(adjacency_matrix) -> Tuple:
+        """Content hash of an adjacency matrix, used as the memoization key"""
+        digest = hashlib.blake2b(digest_size=16)
+        if sparse.issparse(adjacency_matrix):
+            A = sparse.csr_matrix(adjacency_matrix)
+            for part in (A.data, A.indices, A.indptr):
+                digest.update(np.ascontiguousarray(part))
+        else:
+            A = np.ascontiguousarray(adjacency_matrix)
+            digest.update(A)
+        return digest.digest(), A.shape, A.dtype.str, sparse.issparse(A)
+    
+    def _cached_network_metrics(self, key: Tuple) -> Optional[_NetworkMetricsFast]:
+        """Look up memoized network metrics, marking them recently used"""
+        network_metrics = self._network_cache.get(key)
+        if network_metrics is not None:
+            self._network_cache.move_to_end(key)
+        return network_metrics
+    
+    def _cache_network_metrics(self, key: Tuple, network_metrics: _NetworkMetricsFast) -> None:
+        """Memoize network metrics, evicting the least recently used"""
+        self._network_cache[key] = network_metrics
+        if len(self._network_cache) > _NETWORK_CACHE_SIZE:
+            self._network_cache.popitem(last=False)
+    
+    @staticmethod
+    def _network_metrics(adjacency_matrix) -> _NetworkMetricsFast:
+        """
+        Network metrics without Pydantic validation
+        
+        Adjacency entries should be 0/1. The matrix is cast once to float32,
+        which counts paths exactly for networks below 2**24 nodes; degree and
+        trace reductions accumulate in float64.
+        """
+        node_count = adjacency_matrix.shape[0]
+        is_sparse = sparse.issparse(adjacency_matrix) or (
+            node_count >= _SPARSE_MIN_NODES and
+            np.count_nonzero(adjacency_matrix) < _SPARSE_MAX_DENSITY * node_count * node_count
+        )
+        if is_sparse:
+            A = sparse.csr_matrix(adjacency_matrix, dtype=np.float32)
+            degrees = np.asarray(A.sum(axis=1, dtype=np.float64)).ravel()
+        else:
+            A = np.ascontiguousarray(adjacency_matrix, dtype=np.float32)
+            degrees = A.sum(axis=1, dtype=np.float64)
+        
         # Calculate basic network metrics
-        node_count = len(adjacency_matrix)
-        edge_count = np.sum(adjacency_matrix) / 2
-        degrees = np.sum(adjacency_matrix, axis=1)
-        average_degree = np.mean(degrees)
-        
-        # Calculate clustering coefficient
-        triangles = np.trace(np.linalg.matrix_power(adjacency_matrix, 3)) / 6
-        possible_triangles = np.sum(degrees * (degrees - 1)) / 2
+        edge_count = degrees.sum() / 2
+        average_degree = degrees.mean()
+        
+        # Calculate clustering coefficient from trace(A^3) without forming A^3;
+        # sparse networks only touch stored entries and large symmetric dense
+        # networks use the symmetric eigensolver
+        if is_sparse:
+            trace_a3 = (A @ A).multiply(A.T).sum(dtype=np.float64)
+        elif node_count >= _EIGVALSH_MIN_NODES and np.array_equal(A, A.T):
+            # Summing cubed eigenvalues cancels heavily, so solve in float64
+            trace_a3 = np.sum(np.linalg.eigvalsh(A.astype(np.float64)) ** 3)
+        else:
+            trace_a3 = np.einsum('ij,ji->', A @ A, A, dtype=np.float64)
+        triangles = trace_a3 / 6
+        possible_triangles = (degrees @ degrees - degrees.sum()) / 2
         clustering_coefficient = triangles / possible_triangles if possible_triangles > 0 else 0
         
         # Calculate network centralization
         max_degree = np.max(degrees)
         centralization = np.sum(max_degree - degrees) / (node_count * (node_count - 1))
         
-        return NetworkMetrics(
+        return _NetworkMetricsFast(
             node_count=node_count,
             edge_count=edge_count,
-            average_degree=average_degree,
-            clustering_coefficient=clustering_coefficient,
-            centralization=centralization
+            average_degree=float(average_degree),
+            clustering_coefficient=float(clustering_coefficient),
+            centralization=float(centralization)
         )
     
     def calculate_liquidity_risk(self,
@@ -82,12 +231,11 @@ class AdvancedRiskModels:
         Returns:
             LiquidityMetrics object
         """
-        # Calculate turnover ratio
-        turnover_ratio = trading_data['volume'] / trading_data['market_cap']
-        
-        # Calculate liquidity ratio
-        liquidity_ratio = (trading_data['volume'] * 
-                         (1 - trading_data['spread'])) / trading_data['market_cap']
+        turnover_ratio, liquidity_ratio = self._liquidity_ratios(
+            trading_data['volume'],
+            trading_data['market_cap'],
+            trading_data['spread']
+        )
         
         return LiquidityMetrics(
             trading_volume=trading_data['volume'],
@@ -108,17 +256,15 @@ class AdvancedRiskModels:
         Returns:
             Operational risk score (0-1)
         """
-        # Calculate component risk scores
-        availability_risk = 1 - system_metrics['uptime']
-        performance_risk = 1 - (system_metrics['response_time'] / system_metrics['target_response_time'])
-        security_risk = system_metrics['security_incidents'] / system_metrics['total_incidents']
-        
-        # Weighted combination of risk scores
-        risk_score = (0.4 * availability_risk +
-                     0.3 * performance_risk +
-                     0.3 * security_risk)
+        risk_score = self._operational_risk(
+            system_metrics['uptime'],
+            system_metrics['response_time'],
+            system_metrics['target_response_time'],
+            system_metrics['security_incidents'],
+            system_metrics['total_incidents']
+        )
         
-        return min(max(risk_score, 0), 1)
+        return _clip01(risk_score)
     
     def assess_systemic_risk(self,
                            network_metrics: NetworkMetrics,
@@ -135,65 +281,191 @@ class AdvancedRiskModels:
         Returns:
             Systemic risk score (0-1)
         """
+        net_w, liq_w, sys_w = self._NET_W, self._LIQ_W, self._SYS_W
+        
         # Calculate network risk component
-        network_risk = (0.3 * network_metrics.centralization +
-                       0.3 * (1 - network_metrics.clustering_coefficient) +
-                       0.4 * (network_metrics.average_degree / network_metrics.node_count))
+        network_risk = (net_w[0] * network_metrics.centralization +
+                       net_w[1] * (1 - network_metrics.clustering_coefficient) +
+                       net_w[2] * (network_metrics.average_degree / network_metrics.node_count))
         
         # Calculate liquidity risk component
-        liquidity_risk = (0.4 * (1 - liquidity_metrics.liquidity_ratio) +
-                         0.3 * liquidity_metrics.bid_ask_spread +
-                         0.3 * (1 - liquidity_metrics.turnover_ratio))
+        liquidity_risk = (liq_w[0] * (1 - liquidity_metrics.liquidity_ratio) +
+                         liq_w[1] * liquidity_metrics.bid_ask_spread +
+                         liq_w[2] * (1 - liquidity_metrics.turnover_ratio))
         
         # Combine risk components
-        systemic_risk = (0.4 * network_risk +
-                        0.3 * liquidity_risk +
-                        0.3 * operational_risk)
+        systemic_risk = (sys_w[0] * network_risk +
+                        sys_w[1] * liquidity_risk +
+                        sys_w[2] * operational_risk)
+        
+        return _clip01(systemic_risk)
+    
+    @staticmethod
+    def _liquidity_ratios(volume, market_cap, spread):
+        """Turnover and liquidity ratios; accepts scalars or arrays"""
+        turnover_ratio = volume / market_cap
+        liquidity_ratio = (volume * (1 - spread)) / market_cap
+        return turnover_ratio, liquidity_ratio
+    
+    @staticmethod
+    def _operational_risk(uptime,
+                          response_time,
+                          target_response_time,
+                          security_incidents,
+                          total_incidents):
+        """Unclamped operational risk score; accepts scalars or arrays"""
+        # Calculate component risk scores
+        availability_risk = 1 - uptime
+        performance_risk = 1 - (response_time / target_response_time)
+        security_risk = security_incidents / total_incidents
+        
+        # Weighted combination of risk scores
+        return (0.4 * availability_risk +
+                0.3 * performance_risk +
+                0.3 * security_risk)
+    
+    @classmethod
+    def _systemic_risk(cls,
+                       centralization,
+                       clustering_coefficient,
+                       degree_ratio,
+                       liquidity_ratio,
+                       bid_ask_spread,
+                       turnover_ratio,
+                       operational_risk):
+        """Unclamped systemic risk scores for arrays of stress scenarios"""
+        # Calculate network risk component
+        network_risk = np.stack([
+            centralization,
+            1 - clustering_coefficient,
+            degree_ratio
+        ], axis=-1) @ cls._NET_W_ARR
         
-        return min(max(systemic_risk, 0), 1)
+        # Calculate liquidity risk component
+        liquidity_risk = np.stack([
+            1 - liquidity_ratio,
+            bid_ask_spread,
+            1 - turnover_ratio
+        ], axis=-1) @ cls._LIQ_W_ARR
+        
+        # Combine risk components
+        return np.stack([network_risk, liquidity_risk, operational_risk], axis=-1) @ cls._SYS_W_ARR
     
     def stress_test(self,
                    initial_conditions: Dict,
-                   shock_scenarios: List[Dict]) -> pd.DataFrame:
+                   shock_scenarios: List[Dict],
+                   primary_shocks: Optional[np.ndarray] = None,
+                   n_jobs: int = -1,
+                   as_dict: bool = False) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
         """
         Perform stress testing
         
         Args:
             initial_conditions: Initial economic conditions
             shock_scenarios: List of shock scenarios
+            primary_shocks: Optional (scenarios, factors) array of uncorrelated
+                factor shocks, correlated through the covariance set with
+                set_factor_covariance and added to the scenario shocks
+            n_jobs: Number of joblib workers for the per-scenario network
+                metrics (-1 uses all CPUs)
+            as_dict: Return a dict of column arrays instead of a DataFrame
             
         Returns:
-            DataFrame with stress test results
+            DataFrame with stress test results, or the uncopied
+            column arrays when as_dict is True
         """
-        results = []
-        
+        # Canonicalize the shocked and risk-relevant condition keys to column
+        # indices, reusing the last layout; other conditions are left untouched
+        shocked_keys = dict.fromkeys(self._STRESS_KEYS)
+        if primary_shocks is not None:
+            shocked_keys.update(dict.fromkeys(self._factor_keys))
         for scenario in shock_scenarios:
-            # Apply shock to initial conditions
-            shocked_conditions = initial_conditions.copy()
-            for key, value in scenario['shocks'].items():
-                shocked_conditions[key] *= (1 + value)
-            
-            # Calculate risk metrics under shocked conditions
-            network_risk = self.calculate_network_risk(scenario['network'])
-            liquidity_risk = self.calculate_liquidity_risk(shocked_conditions)
-            operational_risk = self.assess_operational_risk(shocked_conditions)
-            
-            # Calculate systemic risk
-            systemic_risk = self.assess_systemic_risk(
-                network_risk,
-                liquidity_risk,
-                operational_risk
+            shocked_keys.update(dict.fromkeys(scenario['shocks']))
+        keys = list(shocked_keys)
+        if keys != self._cond_keys:
+            self._cond_keys = keys
+            self._cond_idx = {key: i for i, key in enumerate(keys)}
+        column = self._cond_idx
+        init_vec = np.fromiter((initial_conditions[key] for key in keys), dtype=np.float64, count=len(keys))
+        
+        # Apply all scenario shocks to the initial conditions in one broadcast
+        shock_mat = np.ones((len(shock_scenarios), len(keys)))
+        for i, scenario in enumerate(shock_scenarios):
+            shocks = scenario['shocks']
+            idx = np.fromiter((column[key] for key in shocks), dtype=np.intp, count=len(shocks))
+            shock_mat[i, idx] += np.fromiter(shocks.values(), dtype=np.float64, count=len(shocks))
+        if primary_shocks is not None:
+            if self._chol is None:
+                raise ValueError("Factor covariance has not been set")
+            factor_cols = [column[key] for key in self._factor_keys]
+            shock_mat[:, factor_cols] += np.asarray(primary_shocks, dtype=np.float64) @ self._chol.T
+        shocked = init_vec * shock_mat
+        
+        # Calculate liquidity and operational risk across all scenarios
+        spread = shocked[:, column['spread']]
+        turnover_ratio, liquidity_ratio = self._liquidity_ratios(
+            shocked[:, column['volume']],
+            shocked[:, column['market_cap']],
+            spread
+        )
+        operational_risk = _clip01_arr(self._operational_risk(
+            shocked[:, column['uptime']],
+            shocked[:, column['response_time']],
+            shocked[:, column['target_response_time']],
+            shocked[:, column['security_incidents']],
+            shocked[:, column['total_incidents']]
+        ))
+        
+        # Network risk depends on each scenario's adjacency matrix
+        n = len(shock_scenarios)
+        names = np.empty(n, dtype=object)
+        centralization = np.empty(n)
+        clustering = np.empty(n)
+        degree_ratio = np.empty(n)
+        networks = [self._as_network(scenario['network']) for scenario in shock_scenarios]
+        keys = [self._network_key(network) for network in networks]
+        metrics = {key: self._cached_network_metrics(key) for key in keys}
+        missing = {key: network for key, network in zip(keys, networks)
+                   if metrics[key] is None}
+        if len(missing) < _PARALLEL_MIN_NETWORKS or n_jobs == 1:
+            computed = [self._network_metrics(network) for network in missing.values()]
+        else:
+            # Threads avoid process start-up costs unless there are plenty of networks
+            prefer = 'processes' if len(missing) >= 2 * (os.cpu_count() or 1) else 'threads'
+            computed = Parallel(n_jobs=n_jobs, prefer=prefer)(
+                delayed(self._network_metrics)(network) for network in missing.values()
             )
-            
-            results.append({
-                'scenario': scenario['name'],
-                'network_risk': network_risk.centralization,
-                'liquidity_risk': liquidity_risk.liquidity_ratio,
-                'operational_risk': operational_risk,
-                'systemic_risk': systemic_risk
-            })
-            
-        return pd.DataFrame(results)
+        for key, network_metrics in zip(missing, computed):
+            metrics[key] = network_metrics
+            self._cache_network_metrics(key, network_metrics)
+        for i, (scenario, key) in enumerate(zip(shock_scenarios, keys)):
+            network_metrics = metrics[key]
+            names[i] = scenario['name']
+            centralization[i] = network_metrics.centralization
+            clustering[i] = network_metrics.clustering_coefficient
+            degree_ratio[i] = network_metrics.average_degree / network_metrics.node_count
+        
+        # Calculate systemic risk
+        systemic_risk = _clip01_arr(self._systemic_risk(
+            centralization,
+            clustering,
+            degree_ratio,
+            liquidity_ratio,
+            spread,
+            turnover_ratio,
+            operational_risk
+        ))
+        
+        results = {
+            'scenario': names,
+            'network_risk': centralization,
+            'liquidity_risk': liquidity_ratio,
+            'operational_risk': operational_risk,
+            'systemic_risk': systemic_risk
+        }
+        if as_dict:
+            return results
+        return pd.DataFrame(results, copy=False)
 
 # Example usage
 if __name__ == "__main__":
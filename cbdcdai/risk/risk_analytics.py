@@ -10,6 +10,15 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
+from scipy.special import expit
+
+def _clip01(x: float) -> float:
+    """Clamp a scalar risk score to [0, 1]"""
+    return max(0.0, min(1.0, x))
+
+def _clip01_arr(x: np.ndarray) -> np.ndarray:
+    """Clamp an array of risk scores to [0, 1] in place"""
+    return np.clip(x, 0, 1, out=x)
 
 class RiskMetrics(BaseModel):
     """Risk metrics for CBDC operations"""
@@ -40,7 +49,10 @@ class RiskAnalytics:
         Returns:
             Value at Risk
         """
-        return np.percentile(returns, (1 - confidence_level) * 100)
+        # Order statistic via introselect rather than a full sort
+        returns = np.asarray(returns, dtype=np.float64)
+        k = min(int((1 - confidence_level) * len(returns)), len(returns) - 1)
+        return np.partition(returns, k)[k]
     
     def calculate_expected_shortfall(self,
                                    returns: np.ndarray,
@@ -57,6 +69,27 @@ class RiskAnalytics:
         """
         return np.mean(returns[returns <= var])
     
+    def _var_es(self,
+                returns: np.ndarray,
+                levels: Tuple[float, ...] = (0.95, 0.99)) -> Tuple[float, ...]:
+        """
+        Calculate VaR at several confidence levels and Expected Shortfall
+        from a single partition of the returns
+        
+        Args:
+            returns: Array of historical returns
+            levels: Confidence levels for VaR; Expected Shortfall uses the first
+            
+        Returns:
+            Tuple of VaR per confidence level followed by Expected Shortfall
+        """
+        returns = np.asarray(returns, dtype=np.float64)
+        cutoffs = [int((1 - level) * len(returns)) for level in levels]
+        partitioned = np.partition(returns, cutoffs)
+        var = tuple(partitioned[i] for i in cutoffs)
+        expected_shortfall = partitioned[:cutoffs[0] + 1].mean()
+        return var + (expected_shortfall,)
+    
     def assess_liquidity_risk(self,
                             trading_volume: float,
                             market_cap: float,
@@ -78,7 +111,7 @@ class RiskAnalytics:
         
         # Combine metrics into risk score
         risk_score = 0.7 * (1 - turnover_ratio) + 0.3 * spread_impact
-        return min(max(risk_score, 0), 1)
+        return _clip01(risk_score)
     
     def assess_operational_risk(self,
                               system_uptime: float,
@@ -102,7 +135,7 @@ class RiskAnalytics:
         
         # Combine metrics into risk score
         risk_score = 0.4 * availability_risk + 0.3 * volume_risk + 0.3 * error_risk
-        return min(max(risk_score, 0), 1)
+        return _clip01(risk_score)
     
     def assess_systemic_risk(self,
                            network_size: int,
@@ -120,13 +153,13 @@ class RiskAnalytics:
             Systemic risk score (0-1)
         """
         # Calculate systemic risk metrics
-        size_risk = 1 - (1 / (1 + np.exp(-network_size/1000)))  # Sigmoid function
+        size_risk = expit(-network_size / 1000)  # 1 - sigmoid(size / 1000)
         concentration_risk = concentration_ratio
         interdependency_risk = interdependency_score
         
         # Combine metrics into risk score
         risk_score = 0.3 * size_risk + 0.4 * concentration_risk + 0.3 * interdependency_risk
-        return min(max(risk_score, 0), 1)
+        return _clip01(risk_score)
     
     def generate_risk_report(self,
                            returns: np.ndarray,
@@ -146,9 +179,7 @@ class RiskAnalytics:
             RiskMetrics object with comprehensive risk assessment
         """
         # Calculate VaR metrics
-        var_95 = self.calculate_var(returns, 0.95)
-        var_99 = self.calculate_var(returns, 0.99)
-        expected_shortfall = self.calculate_expected_shortfall(returns, var_95)
+        var_95, var_99, expected_shortfall = self._var_es(returns, (0.95, 0.99))
         
         # Calculate risk scores
         liquidity_risk = self.assess_liquidity_risk(
@@ -169,13 +200,14 @@ class RiskAnalytics:
             systemic_metrics['interdependency']
         )
         
-        return RiskMetrics(
-            var_95=var_95,
-            var_99=var_99,
-            expected_shortfall=expected_shortfall,
-            liquidity_risk=liquidity_risk,
-            operational_risk=operational_risk,
-            systemic_risk=systemic_risk
+        # Every field is computed above, so skip Pydantic validation
+        return RiskMetrics.model_construct(
+            var_95=float(var_95),
+            var_99=float(var_99),
+            expected_shortfall=float(expected_shortfall),
+            liquidity_risk=float(liquidity_risk),
+            operational_risk=float(operational_risk),
+            systemic_risk=float(systemic_risk)
         )
 
 # Example usage
@@ -8,13 +8,74 @@ Advanced economic models for CBDC simulation, including:
 - Money Multiplier effects
 """
 
+import math
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+
+from .._numba import njit, prange
+
+@njit(cache=True, fastmath=True)
+def _taylor_rule(inflation_rate, output_gap, natural_rate,
+                 inflation_weight, inflation_target, output_gap_weight):
+    """Taylor Rule interest rate"""
+    return (natural_rate +
+            inflation_weight * (inflation_rate - inflation_target) +
+            output_gap_weight * output_gap)
+
+@njit(cache=True, fastmath=True)
+def _phillips_curve(unemployment_rate, expected_inflation, supply_shock):
+    """Phillips Curve inflation with a 5% natural rate of unemployment"""
+    return (expected_inflation -
+            0.5 * (unemployment_rate - 0.05) +
+            supply_shock)
+
+@njit(cache=True, fastmath=True)
+def _money_multiplier(reserve_ratio, currency_ratio, cbdc_ratio):
+    """Money multiplier 1 / (r + c + cbdc)"""
+    return 1 / (reserve_ratio + currency_ratio + cbdc_ratio)
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _sensitivity_kernel(inflation_rate, output_gap, cbdc_adoption, natural_rate,
+                        inflation_weight, inflation_target, output_gap_weight,
+                        reserve_ratio, currency_ratio):
+    """Taylor Rule rates and money multipliers across a scenario grid"""
+    n = inflation_rate.shape[0]
+    rates = np.empty(n)
+    multipliers = np.empty(n)
+    for i in prange(n):
+        rates[i] = _taylor_rule(inflation_rate[i], output_gap[i], natural_rate,
+                                inflation_weight, inflation_target, output_gap_weight)
+        multipliers[i] = _money_multiplier(reserve_ratio, currency_ratio, cbdc_adoption[i])
+    return rates, multipliers
+
+@lru_cache(maxsize=16)
+def _monetary_impact_kernel(periods: int):
+    """Monetary impact kernel specialized for a fixed number of periods"""
+    @njit(fastmath=True)
+    def kernel(interest_rate0, inflation0, output, potential_output, unemployment,
+               cbdc_adoption0, reserve_ratio, currency_ratio, policy_shock):
+        interest_rate = np.empty(periods)
+        inflation = np.empty(periods)
+        output_gap = np.full(periods, (output - potential_output) / potential_output)
+        cbdc_adoption = np.empty(periods)
+        multiplier = np.empty(periods)
+        inflation_step = _phillips_curve(unemployment, 0.0, 0.0)
+        for t in range(periods):
+            interest_rate[t] = interest_rate0 + policy_shock * -math.expm1(-t / 3)
+            inflation[t] = inflation0 + inflation_step * (t + 1)
+            cbdc_adoption[t] = min(cbdc_adoption0 + 0.01 * (t + 1), 1.0)
+            multiplier[t] = _money_multiplier(reserve_ratio, currency_ratio, cbdc_adoption[t])
+        return interest_rate, inflation, output_gap, cbdc_adoption, multiplier
+    
+    return kernel
 
 class EconomicParameters(BaseModel):
     """Parameters for economic models"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     natural_rate: float = Field(..., description="Natural rate of interest")
     inflation_target: float = Field(..., description="Inflation target")
     output_gap_weight: float = Field(..., description="Output gap weight in Taylor rule")
@@ -22,11 +83,37 @@ class EconomicParameters(BaseModel):
     money_velocity: float = Field(..., description="Money velocity")
     fiscal_multiplier: float = Field(..., description="Fiscal multiplier")
 
+class _FastParams(NamedTuple):
+    """Plain-float copy of EconomicParameters for hot paths"""
+    natural_rate: float
+    inflation_target: float
+    output_gap_weight: float
+    inflation_weight: float
+    money_velocity: float
+    fiscal_multiplier: float
+
 class EconomicModels:
     """Economic models for CBDC simulation"""
     
     def __init__(self, parameters: EconomicParameters):
         self.parameters = parameters
+    
+    @property
+    def parameters(self) -> EconomicParameters:
+        """Validated model parameters; hot paths read the _p snapshot instead"""
+        return self._parameters
+    
+    @parameters.setter
+    def parameters(self, parameters: EconomicParameters) -> None:
+        self._parameters = parameters
+        self._p = _FastParams(
+            float(parameters.natural_rate),
+            float(parameters.inflation_target),
+            float(parameters.output_gap_weight),
+            float(parameters.inflation_weight),
+            float(parameters.money_velocity),
+            float(parameters.fiscal_multiplier)
+        )
         
     def taylor_rule(self,
                    inflation_rate: float,
@@ -43,11 +130,12 @@ class EconomicModels:
         Returns:
             Recommended interest rate
         """
-        natural_rate = natural_rate or self.parameters.natural_rate
+        parameters = self._p
+        natural_rate = natural_rate or parameters.natural_rate
         
-        return (natural_rate + 
-                self.parameters.inflation_weight * (inflation_rate - self.parameters.inflation_target) +
-                self.parameters.output_gap_weight * output_gap)
+        return (natural_rate +
+                parameters.inflation_weight * (inflation_rate - parameters.inflation_target) +
+                parameters.output_gap_weight * output_gap)
     
     def phillips_curve(self,
                       unemployment_rate: float,
@@ -65,7 +153,7 @@ class EconomicModels:
             Inflation rate
         """
         # Simplified Phillips Curve with supply shock
-        return (expected_inflation - 
+        return (expected_inflation -
                 0.5 * (unemployment_rate - 0.05) +  # 5% natural rate of unemployment
                 supply_shock)
     
@@ -99,7 +187,7 @@ class EconomicModels:
         cbdc_impact = 1 + 0.2 * cbdc_adoption
         
         # IS curve: Y = C + I + G
-        is_output = (autonomous_spending + 
+        is_output = (autonomous_spending +
                     marginal_propensity_consume * government_spending -
                     investment_sensitivity * interest_rate)
         
@@ -143,46 +231,194 @@ class EconomicModels:
         Returns:
             DataFrame with simulation results
         """
-        results = []
-        
         # Initial conditions
-        interest_rate = initial_conditions['interest_rate']
-        inflation = initial_conditions['inflation']
+        interest_rate0 = initial_conditions['interest_rate']
+        inflation0 = initial_conditions['inflation']
         output = initial_conditions['output']
-        cbdc_adoption = initial_conditions['cbdc_adoption']
+        potential_output = initial_conditions['potential_output']
+        unemployment = initial_conditions['unemployment']
+        cbdc_adoption0 = initial_conditions['cbdc_adoption']
+        reserve_ratio = initial_conditions['reserve_ratio']
+        currency_ratio = initial_conditions['currency_ratio']
         
-        for period in range(periods):
-            # Apply policy shock
-            interest_rate += policy_shock * (1 - np.exp(-period/3))
-            
-            # Calculate economic impacts
-            output_gap = (output - initial_conditions['potential_output']) / initial_conditions['potential_output']
-            inflation = self.phillips_curve(
-                initial_conditions['unemployment'],
-                inflation,
-                supply_shock=0.0
-            )
-            
-            # Calculate CBDC impact
-            cbdc_adoption = min(cbdc_adoption + 0.01, 1.0)  # Gradual adoption
+        period = np.arange(periods)
+        elapsed = np.arange(1, periods + 1, dtype=np.float64)
+        
+        # Preallocate one contiguous buffer per simulated series
+        interest_rate = np.empty(periods)
+        inflation = np.empty(periods)
+        output_gap = np.empty(periods)
+        cbdc_adoption = np.empty(periods)
+        
+        # Apply policy shock, passed through gradually to the full change
+        np.divide(period, -3, out=interest_rate)
+        np.expm1(interest_rate, out=interest_rate)
+        interest_rate *= -policy_shock
+        interest_rate += interest_rate0
+        
+        # Calculate economic impacts; the Phillips curve feeds last period's
+        # inflation back in, so inflation moves by a constant step per period
+        output_gap.fill((output - potential_output) / potential_output)
+        inflation_step = self.phillips_curve(unemployment, 0.0, supply_shock=0.0)
+        np.multiply(elapsed, inflation_step, out=inflation)
+        inflation += inflation0
+        
+        # Calculate CBDC impact
+        np.multiply(elapsed, 0.01, out=cbdc_adoption)
+        cbdc_adoption += cbdc_adoption0
+        np.minimum(cbdc_adoption, 1.0, out=cbdc_adoption)  # Gradual adoption
+        
+        # Calculate money multiplier
+        multiplier = self.money_multiplier(reserve_ratio, currency_ratio, cbdc_adoption)
+        
+        return pd.DataFrame({
+            'period': period,
+            'interest_rate': interest_rate,
+            'inflation': inflation,
+            'output_gap': output_gap,
+            'cbdc_adoption': cbdc_adoption,
+            'money_multiplier': multiplier
+        }, copy=False)
+    
+    def compile_simulator(self, periods: int) -> Callable[[Dict, float], pd.DataFrame]:
+        """
+        Build a monetary impact simulator specialized for a fixed horizon
+        
+        The numeric kernel is JIT-compiled with periods baked in on first use
+        and cached per horizon, so repeated scenarios at the same horizon skip
+        shape handling and reuse the compiled code.
+        
+        Args:
+            periods: Number of periods to simulate
             
-            # Calculate money multiplier
-            multiplier = self.money_multiplier(
-                initial_conditions['reserve_ratio'],
-                initial_conditions['currency_ratio'],
-                cbdc_adoption
+        Returns:
+            Function taking (initial_conditions, policy_shock) and returning
+            the same DataFrame as simulate_monetary_impact
+        """
+        kernel = _monetary_impact_kernel(periods)
+        
+        def simulate(initial_conditions: Dict, policy_shock: float) -> pd.DataFrame:
+            interest_rate, inflation, output_gap, cbdc_adoption, multiplier = kernel(
+                float(initial_conditions['interest_rate']),
+                float(initial_conditions['inflation']),
+                float(initial_conditions['output']),
+                float(initial_conditions['potential_output']),
+                float(initial_conditions['unemployment']),
+                float(initial_conditions['cbdc_adoption']),
+                float(initial_conditions['reserve_ratio']),
+                float(initial_conditions['currency_ratio']),
+                float(policy_shock)
             )
-            
-            results.append({
-                'period': period,
+            return pd.DataFrame({
+                'period': np.arange(periods),
                 'interest_rate': interest_rate,
                 'inflation': inflation,
                 'output_gap': output_gap,
                 'cbdc_adoption': cbdc_adoption,
                 'money_multiplier': multiplier
-            })
+            }, copy=False)
+        
+        return simulate
+    
+    def simulate_sensitivity_grid(self,
+                                  inflation_rates: np.ndarray,
+                                  output_gaps: np.ndarray,
+                                  cbdc_adoption: np.ndarray,
+                                  reserve_ratio: float,
+                                  currency_ratio: float) -> Dict[str, np.ndarray]:
+        """
+        Evaluate policy rates and money multipliers across a scenario grid
+        
+        Args:
+            inflation_rates: Inflation rate per scenario
+            output_gaps: Output gap per scenario
+            cbdc_adoption: CBDC to deposit ratio per scenario
+            reserve_ratio: Reserve requirement ratio
+            currency_ratio: Currency to deposit ratio
             
-        return pd.DataFrame(results)
+        Returns:
+            Dictionary with the Taylor Rule interest rate and money
+            multiplier per scenario
+        """
+        natural_rate, inflation_target, output_gap_weight, inflation_weight = self._p[:4]
+        inflation_rates, output_gaps, cbdc_adoption = np.broadcast_arrays(
+            np.asarray(inflation_rates, dtype=np.float64),
+            np.asarray(output_gaps, dtype=np.float64),
+            np.asarray(cbdc_adoption, dtype=np.float64)
+        )
+        shape = inflation_rates.shape
+        
+        interest_rate, multiplier = _sensitivity_kernel(
+            np.ascontiguousarray(inflation_rates).ravel(),
+            np.ascontiguousarray(output_gaps).ravel(),
+            np.ascontiguousarray(cbdc_adoption).ravel(),
+            natural_rate,
+            inflation_weight,
+            inflation_target,
+            output_gap_weight,
+            float(reserve_ratio),
+            float(currency_ratio)
+        )
+        
+        return {
+            'interest_rate': interest_rate.reshape(shape),
+            'money_multiplier': multiplier.reshape(shape)
+        }
+    
+    def simulate_monetary_impact_batch(self,
+                                       initial_conditions: pd.DataFrame,
+                                       policy_shocks: np.ndarray,
+                                       periods: int = 12,
+                                       dtype: np.dtype = np.float64) -> Dict[str, np.ndarray]:
+        """
+        Simulate monetary policy impact for a batch of scenarios
+        
+        Args:
+            initial_conditions: Initial economic conditions, one row per scenario
+            policy_shocks: Policy rate change per scenario
+            periods: Number of periods to simulate
+            dtype: Floating dtype of the simulated series; np.float32 halves
+                memory traffic for large batches at reduced precision
+            
+        Returns:
+            Dictionary with the period array and one (scenarios, periods)
+            array per simulated series
+        """
+        period = np.arange(periods)
+        elapsed = np.arange(1, periods + 1, dtype=dtype)
+        shock_profile = (-np.expm1(-period/3)).astype(dtype, copy=False)
+        interest_rate0 = initial_conditions['interest_rate'].to_numpy(dtype=dtype)[:, None]
+        inflation0 = initial_conditions['inflation'].to_numpy(dtype=dtype)[:, None]
+        output = initial_conditions['output'].to_numpy(dtype=dtype)
+        potential_output = initial_conditions['potential_output'].to_numpy(dtype=dtype)
+        unemployment = initial_conditions['unemployment'].to_numpy(dtype=dtype)[:, None]
+        cbdc_adoption0 = initial_conditions['cbdc_adoption'].to_numpy(dtype=dtype)[:, None]
+        reserve_ratio = initial_conditions['reserve_ratio'].to_numpy(dtype=dtype)[:, None]
+        currency_ratio = initial_conditions['currency_ratio'].to_numpy(dtype=dtype)[:, None]
+        policy_shocks = np.asarray(policy_shocks, dtype=dtype)[:, None]
+        
+        # Apply policy shock, passed through gradually to the full change
+        interest_rate = interest_rate0 + policy_shocks * shock_profile
+        
+        # Calculate economic impacts
+        output_gap = (output - potential_output) / potential_output
+        inflation_step = np.asarray(self.phillips_curve(unemployment, 0.0, supply_shock=0.0), dtype=dtype)
+        inflation = inflation0 + inflation_step * elapsed
+        
+        # Calculate CBDC impact
+        cbdc_adoption = np.minimum(cbdc_adoption0 + 0.01 * elapsed, 1.0)  # Gradual adoption
+        
+        # Calculate money multiplier with one reciprocal over the whole batch
+        multiplier = np.reciprocal(reserve_ratio + currency_ratio + cbdc_adoption)
+        
+        return {
+            'period': period,
+            'interest_rate': interest_rate,
+            'inflation': inflation,
+            'output_gap': np.broadcast_to(output_gap[:, None], interest_rate.shape),
+            'cbdc_adoption': cbdc_adoption,
+            'money_multiplier': multiplier
+        }
 
 # Example usage
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ Test script to verify CBDCDAI simulation functionality
 """
 
 from cbdcdai.simulation.economic_models import EconomicModels, EconomicParameters
+import time
 import pandas as pd
 import numpy as np
 
@@ -63,16 +64,21 @@ def test_simulation():
         'currency_ratio': 0.2
     }
     
+    t0 = time.perf_counter()
     results = models.simulate_monetary_impact(
         initial_conditions=initial_conditions,
         policy_shock=0.01,
         periods=12
     )
+    elapsed = time.perf_counter() - t0
     
-    print("\nSimulation Results:")
-    print(results.to_string())
+    assert isinstance(results, pd.DataFrame)
+    assert len(results) == 12
+    assert np.isfinite(results.to_numpy()).all()
     
-    return results
+    print(f"\nSimulation Time: {elapsed * 1e3:.3f} ms")
+    print("Simulation Results (first and last period):")
+    print(results.iloc[[0, -1]])
 
 if __name__ == "__main__":
     test_simulation() 
\ No newline at end of file
@@ -5,26 +5,57 @@ Comprehensive test suite for advanced CBDCDAI modules, including:
 - Economic models
 - Risk models
 - Compliance monitoring
+- API endpoints
 """
 
 import pytest
 import numpy as np
 import pandas as pd
+from scipy import sparse
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
 
 from cbdcdai.simulation.economic_models import EconomicModels, EconomicParameters
-from cbdcdai.risk.advanced_risk_models import AdvancedRiskModels, NetworkMetrics, LiquidityMetrics
+from cbdcdai.risk.advanced_risk_models import (
+    AdvancedRiskModels,
+    NetworkMetrics,
+    LiquidityMetrics,
+    _NETWORK_CACHE_SIZE
+)
 from cbdcdai.compliance.advanced_compliance import (
     AdvancedCompliance,
     ComplianceRequirement,
     ComplianceMetrics,
     RegulatoryFramework
 )
+from cbdcdai.compliance.regulatory_compliance import RegulatoryCompliance, Jurisdiction
+from cbdcdai.simulation.cbdc_simulator import CBDCSimulator, CBDCParameters
+from cbdcdai.api import main as api_main
+from cbdcdai.api.main import app
+
+# Fixed timestamps keep the compliance tests deterministic
+_NOW = datetime(2024, 1, 1)
+_TOMORROW = _NOW + timedelta(days=1)
+
+def _random_network(node_count, density, seed):
+    """Random undirected 0/1 adjacency matrix without self-loops"""
+    upper = np.triu(np.random.default_rng(seed).random((node_count, node_count)) < density, 1)
+    return (upper | upper.T).astype(np.int64)
+
+def _einsum_clustering(adjacency_matrix):
+    """Reference clustering coefficient from the dense trace(A^3)"""
+    A = np.asarray(adjacency_matrix, dtype=np.float64)
+    degrees = A.sum(axis=1)
+    triangles = np.einsum('ij,ji->', A @ A, A) / 6
+    return triangles / ((degrees @ degrees - degrees.sum()) / 2)
 
 # Test Economic Models
 class TestEconomicModels:
-    @pytest.fixture
-    def economic_models(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def economic_models(cls):
         params = EconomicParameters(
             natural_rate=0.02,
             inflation_target=0.02,
@@ -72,11 +103,117 @@ class TestEconomicModels:
         )
         assert isinstance(multiplier, float)
         assert multiplier > 0
+    
+    def test_monetary_impact(self, economic_models):
+        # Test policy shock pass-through in the monetary impact simulation
+        initial_conditions = {
+            'interest_rate': 0.02,
+            'inflation': 0.02,
+            'output': 1000,
+            'potential_output': 1000,
+            'unemployment': 0.05,
+            'cbdc_adoption': 0.1,
+            'reserve_ratio': 0.1,
+            'currency_ratio': 0.2
+        }
+        results = economic_models.simulate_monetary_impact(
+            initial_conditions,
+            policy_shock=0.01,
+            periods=24
+        )
+        assert isinstance(results, pd.DataFrame)
+        assert len(results) == 24
+        
+        # The shock is not accumulated: the rate rises towards the full change
+        interest_rate = results['interest_rate'].to_numpy()
+        assert interest_rate[0] == pytest.approx(0.02)
+        assert np.all(np.diff(interest_rate) > 0)
+        assert interest_rate[-1] == pytest.approx(0.03, abs=1e-4)
+        assert interest_rate[3] == pytest.approx(0.02 + 0.01 * (1 - np.exp(-1)))
+    
+    def test_compile_simulator(self, economic_models):
+        # Test the horizon-specialized simulator against the generic one
+        initial_conditions = {
+            'interest_rate': 0.02,
+            'inflation': 0.03,
+            'output': 980,
+            'potential_output': 1000,
+            'unemployment': 0.06,
+            'cbdc_adoption': 0.9,
+            'reserve_ratio': 0.1,
+            'currency_ratio': 0.2
+        }
+        simulate = economic_models.compile_simulator(12)
+        for policy_shock in (0.01, -0.005):
+            pd.testing.assert_frame_equal(
+                simulate(initial_conditions, policy_shock),
+                economic_models.simulate_monetary_impact(initial_conditions, policy_shock, periods=12)
+            )
+        
+        # Results do not share buffers across calls
+        first = simulate(initial_conditions, 0.01)
+        first.loc[0, 'period'] = 99
+        assert simulate(initial_conditions, 0.01)['period'].iloc[0] == 0
+    
+    def test_monetary_impact_batch(self, economic_models):
+        # Test batched scenarios against single-scenario simulations
+        initial_conditions = pd.DataFrame({
+            'interest_rate': [0.02, 0.05],
+            'inflation': [0.02, 0.04],
+            'output': [1000, 950],
+            'potential_output': [1000, 1000],
+            'unemployment': [0.05, 0.08],
+            'cbdc_adoption': [0.1, 0.95],
+            'reserve_ratio': [0.1, 0.05],
+            'currency_ratio': [0.2, 0.1]
+        })
+        policy_shocks = np.array([0.01, -0.02])
+        results = economic_models.simulate_monetary_impact_batch(
+            initial_conditions,
+            policy_shocks,
+            periods=12
+        )
+        assert results['interest_rate'].shape == (2, 12)
+        
+        for i, conditions in enumerate(initial_conditions.to_dict(orient='records')):
+            expected = economic_models.simulate_monetary_impact(
+                conditions,
+                policy_shock=policy_shocks[i],
+                periods=12
+            )
+            for column in expected.columns.drop('period'):
+                np.testing.assert_allclose(results[column][i], expected[column].to_numpy())
+    
+    def test_sensitivity_grid(self, economic_models):
+        # Test the scenario grid against the scalar formulas
+        inflation, output_gap, cbdc_adoption = np.meshgrid(
+            np.linspace(0.0, 0.06, 4),
+            np.linspace(-0.02, 0.02, 3),
+            np.linspace(0.0, 0.5, 2),
+            indexing='ij'
+        )
+        results = economic_models.simulate_sensitivity_grid(
+            inflation,
+            output_gap,
+            cbdc_adoption,
+            reserve_ratio=0.1,
+            currency_ratio=0.2
+        )
+        assert results['interest_rate'].shape == (4, 3, 2)
+        
+        for idx in np.ndindex(inflation.shape):
+            assert results['interest_rate'][idx] == pytest.approx(
+                economic_models.taylor_rule(inflation[idx], output_gap[idx])
+            )
+            assert results['money_multiplier'][idx] == pytest.approx(
+                economic_models.money_multiplier(0.1, 0.2, cbdc_adoption[idx])
+            )
 
 # Test Risk Models
 class TestAdvancedRiskModels:
-    @pytest.fixture
-    def risk_models(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def risk_models(cls):
         return AdvancedRiskModels()
     
     def test_network_risk(self, risk_models):
@@ -91,6 +228,55 @@ class TestAdvancedRiskModels:
         assert isinstance(metrics, NetworkMetrics)
         assert metrics.node_count == 4
         assert metrics.edge_count == 5
+        
+        # Nested lists are accepted like arrays
+        assert risk_models.calculate_network_risk(adjacency_matrix.tolist()) == metrics
+        triangle = risk_models.calculate_network_risk([[0, 1, 1], [1, 0, 1], [1, 1, 0]])
+        assert triangle.clustering_coefficient == pytest.approx(1 / 3)
+    
+    def test_network_risk_sparse(self, risk_models):
+        # Test sparse inputs and large low-density dense inputs match einsum
+        adjacency_matrix = _random_network(300, 0.03, seed=1)
+        expected = _einsum_clustering(adjacency_matrix)
+        for network in (sparse.csr_matrix(adjacency_matrix), adjacency_matrix):
+            metrics = risk_models.calculate_network_risk(network)
+            assert metrics.node_count == 300
+            assert metrics.edge_count == adjacency_matrix.sum() / 2
+            assert metrics.clustering_coefficient == pytest.approx(expected)
+    
+    def test_network_risk_symmetric(self, risk_models):
+        # Test large symmetric dense inputs (eigenvalue path) match einsum
+        adjacency_matrix = _random_network(300, 0.3, seed=2)
+        metrics = risk_models.calculate_network_risk(adjacency_matrix)
+        assert metrics.edge_count == adjacency_matrix.sum() / 2
+        assert metrics.clustering_coefficient == pytest.approx(
+            _einsum_clustering(adjacency_matrix),
+            rel=1e-6
+        )
+    
+    def test_network_cache(self, monkeypatch):
+        # Test repeated topologies hit the memo, with LRU eviction and invalidation
+        risk_models = AdvancedRiskModels()
+        calls = []
+        compute = risk_models._network_metrics
+        monkeypatch.setattr(risk_models, '_network_metrics',
+                            lambda A: calls.append(1) or compute(A))
+        
+        networks = [_random_network(8, 0.5, seed=i) for i in range(_NETWORK_CACHE_SIZE + 1)]
+        first = risk_models.calculate_network_risk(networks[0])
+        assert risk_models.calculate_network_risk(networks[0].copy()) == first
+        assert len(calls) == 1
+        
+        for network in networks[1:]:
+            risk_models.calculate_network_risk(network)
+        assert len(risk_models._network_cache) == _NETWORK_CACHE_SIZE
+        risk_models.calculate_network_risk(networks[0])
+        assert len(calls) == _NETWORK_CACHE_SIZE + 2
+        
+        risk_models.invalidate_cache()
+        assert not risk_models._network_cache
+        risk_models.calculate_network_risk(networks[0])
+        assert len(calls) == _NETWORK_CACHE_SIZE + 3
     
     def test_liquidity_risk(self, risk_models):
         # Test liquidity risk calculation
@@ -140,11 +326,91 @@ class TestAdvancedRiskModels:
         )
         assert isinstance(risk_score, float)
         assert 0 <= risk_score <= 1
+    
+    def test_stress_test(self):
+        # Test stress testing across scenarios; a fresh model keeps the factor
+        # covariance set below out of the shared fixture
+        risk_models = AdvancedRiskModels()
+        initial_conditions = {
+            'volume': 1000000,
+            'market_cap': 10000000,
+            'spread': 0.001,
+            'depth': 500000,
+            'uptime': 0.999,
+            'response_time': 0.1,
+            'target_response_time': 0.2,
+            'security_incidents': 2,
+            'total_incidents': 100
+        }
+        adjacency_matrix = np.array([
+            [0, 1, 1, 0],
+            [1, 0, 1, 1],
+            [1, 1, 0, 1],
+            [0, 1, 1, 0]
+        ])
+        shock_scenarios = [
+            {'name': 'baseline', 'shocks': {}, 'network': adjacency_matrix},
+            {'name': 'liquidity_crunch', 'shocks': {'volume': -0.5, 'spread': 2.0}, 'network': adjacency_matrix}
+        ]
+        results = risk_models.stress_test(initial_conditions, shock_scenarios)
+        assert isinstance(results, pd.DataFrame)
+        assert list(results['scenario']) == ['baseline', 'liquidity_crunch']
+        
+        # Scenario results match the per-scenario risk calculations
+        baseline = risk_models.calculate_liquidity_risk(initial_conditions)
+        assert results['liquidity_risk'].iloc[0] == pytest.approx(baseline.liquidity_ratio)
+        assert results['liquidity_risk'].iloc[1] < results['liquidity_risk'].iloc[0]
+        assert results['operational_risk'].iloc[0] == pytest.approx(
+            risk_models.assess_operational_risk(initial_conditions)
+        )
+        assert results['systemic_risk'].between(0, 1).all()
+        
+        # Systemic risk matches the scalar assessment of each shocked scenario
+        network_metrics = risk_models.calculate_network_risk(adjacency_matrix)
+        for i, scenario in enumerate(shock_scenarios):
+            shocked = {
+                key: value * (1 + scenario['shocks'].get(key, 0))
+                for key, value in initial_conditions.items()
+            }
+            assert results['systemic_risk'].iloc[i] == pytest.approx(risk_models.assess_systemic_risk(
+                network_metrics,
+                risk_models.calculate_liquidity_risk(shocked),
+                risk_models.assess_operational_risk(shocked)
+            ))
+        
+        # Column arrays match the DataFrame columns
+        columns = risk_models.stress_test(initial_conditions, shock_scenarios, as_dict=True)
+        assert isinstance(columns, dict)
+        assert list(columns) == list(results.columns)
+        for name, values in columns.items():
+            assert list(values) == results[name].tolist()
+        
+        # Non-numeric conditions that are never shocked are ignored
+        labelled = risk_models.stress_test({**initial_conditions, 'currency': 'USD'}, shock_scenarios)
+        pd.testing.assert_frame_equal(labelled, results)
+        
+        # Correlated factor shocks propagate through the Cholesky factor
+        risk_models.set_factor_covariance(
+            ['volume', 'market_cap'],
+            np.array([[0.04, 0.02], [0.02, 0.04]])
+        )
+        correlated = risk_models.stress_test(
+            initial_conditions,
+            shock_scenarios,
+            primary_shocks=np.array([[0.0, 0.0], [-1.0, 0.0]])
+        )
+        assert correlated['liquidity_risk'].iloc[0] == pytest.approx(results['liquidity_risk'].iloc[0])
+        volume, market_cap = 0.5 - 0.2, 1 - 0.1
+        assert correlated['liquidity_risk'].iloc[1] == pytest.approx(
+            volume * initial_conditions['volume'] * (1 - 3 * initial_conditions['spread']) /
+            (market_cap * initial_conditions['market_cap'])
+        )
 
 # Test Compliance Monitoring
 class TestAdvancedCompliance:
-    @pytest.fixture
-    def compliance_engine(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def compliance_engine(cls):
         return AdvancedCompliance()
     
     def test_mica_compliance(self, compliance_engine):
@@ -156,6 +422,22 @@ class TestAdvancedCompliance:
         assert isinstance(metrics, ComplianceMetrics)
         assert metrics.framework == RegulatoryFramework.MICA
     
+    def test_mica_compliance_batch(self, compliance_engine):
+        # Test batched MiCA compliance matches the per-record check
+        reserve_ratio = np.array([1.0, 0.9, 1.2, 0.5])
+        transaction_amount = np.array([500000, 500000, 2000000, 2000000])
+        scores, status = compliance_engine.check_mica_compliance_batch(
+            reserve_ratio,
+            transaction_amount
+        )
+        for i in range(len(reserve_ratio)):
+            metrics = compliance_engine.check_mica_compliance(
+                reserve_data={'ratio': reserve_ratio[i]},
+                transaction_data={'amount': transaction_amount[i]}
+            )
+            assert scores[i] == pytest.approx(metrics.compliance_score)
+            assert status[i] == (metrics.status == "Compliant")
+    
     def test_genius_compliance(self, compliance_engine):
         # Test GENIUS Act compliance checking
         metrics = compliance_engine.check_genius_compliance(
@@ -172,8 +454,8 @@ class TestAdvancedCompliance:
                 framework=RegulatoryFramework.MICA,
                 requirement_id="MICA_001",
                 compliance_score=0.9,
-                last_check=datetime.now(),
-                next_check=datetime.now() + timedelta(days=1),
+                last_check=_NOW,
+                next_check=_TOMORROW,
                 violations=[],
                 corrective_actions=[],
                 status="Compliant"
@@ -193,7 +475,7 @@ class TestAdvancedCompliance:
                 threshold=1.0,
                 monitoring_frequency="daily",
                 reporting_frequency="monthly",
-                effective_date=datetime.now(),
+                effective_date=_NOW,
                 jurisdiction="EU",
                 category="Test"
             )
@@ -206,7 +488,7 @@ class TestAdvancedCompliance:
                 threshold=1.1,
                 monitoring_frequency="daily",
                 reporting_frequency="monthly",
-                effective_date=datetime.now(),
+                effective_date=_NOW,
                 jurisdiction="EU",
                 category="Test"
             )
@@ -217,6 +499,15 @@ class TestAdvancedCompliance:
         )
         assert isinstance(changes, list)
         assert len(changes) > 0
+        
+        # Changes are reported in requirement order, not sorted by ID
+        renamed = [
+            replace(requirement, requirement_id=requirement_id)
+            for requirement_id in ("MICA_003", "MICA_002")
+            for requirement in new_requirements
+        ]
+        changes = compliance_engine.monitor_regulatory_changes(current_requirements, renamed)
+        assert [change['requirement_id'] for change in changes] == ["MICA_003", "MICA_002", "MICA_001"]
     
     def test_risk_score(self, compliance_engine):
         # Test compliance risk score calculation
@@ -225,8 +516,8 @@ class TestAdvancedCompliance:
                 framework=RegulatoryFramework.MICA,
                 requirement_id="MICA_001",
                 compliance_score=0.9,
-                last_check=datetime.now(),
-                next_check=datetime.now() + timedelta(days=1),
+                last_check=_NOW,
+                next_check=_TOMORROW,
                 violations=[],
                 corrective_actions=[],
                 status="Compliant"
@@ -234,4 +525,178 @@ class TestAdvancedCompliance:
         ]
         risk_score = compliance_engine.calculate_risk_score(metrics)
         assert isinstance(risk_score, float)
-        assert 0 <= risk_score <= 1 
\ No newline at end of file
+        assert 0 <= risk_score <= 1
+
+
+# Test Regulatory Compliance
+class TestRegulatoryCompliance:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def compliance_engine(cls):
+        return RegulatoryCompliance()
+    
+    def test_transaction_limits_batch(self, compliance_engine):
+        # Test batched limit checks match the per-transaction check
+        amounts = np.array([500000.0, 1000000.0, 1500000.0])
+        limits = compliance_engine.check_transaction_limits_batch(amounts)
+        assert limits.shape == (len(amounts), len(Jurisdiction))
+        for i in range(len(amounts)):
+            for j, jurisdiction in enumerate(Jurisdiction):
+                assert limits[i, j] == compliance_engine.check_transaction_limits(
+                    amounts[i], jurisdiction
+                )
+        
+        jurisdictions = [Jurisdiction.US, 'EU', 'UNKNOWN']
+        limits = compliance_engine.check_transaction_limits_batch(
+            np.array([1500000.0, 500000.0, 1500000.0]),
+            jurisdictions
+        )
+        expected = [
+            compliance_engine.check_transaction_limits(amount, jurisdiction)
+            for amount, jurisdiction in zip([1500000.0, 500000.0, 1500000.0], jurisdictions)
+        ]
+        assert limits.tolist() == expected == [False, True, True]
+    
+    def test_aml_compliance_batch(self, compliance_engine):
+        # Test batched AML scores match the per-record assessment
+        transaction_volume = np.array([1000000.0, 0.0, 500.0, 1000.0])
+        suspicious_transactions = np.array([5, 3, 400, 0])
+        risk_score = np.array([0.1, 0.2, 0.9, 1.5])
+        scores = compliance_engine.assess_aml_compliance_batch(
+            transaction_volume,
+            suspicious_transactions,
+            risk_score
+        )
+        assert scores.shape == transaction_volume.shape
+        for i in range(len(transaction_volume)):
+            assert scores[i] == pytest.approx(compliance_engine.assess_aml_compliance(
+                transaction_volume[i],
+                suspicious_transactions[i],
+                risk_score[i]
+            ))
+        assert ((scores >= 0) & (scores <= 1)).all()
+
+# Test CBDC Simulator
+class TestCBDCSimulator:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def params(cls):
+        return CBDCParameters(
+            interest_rate=0.02,
+            reserve_requirement=0.1,
+            transaction_limit=1000000,
+            holding_limit=10000000,
+            privacy_level=0.7,
+            cross_border_enabled=True
+        )
+    
+    def test_as_dict(self, params):
+        # Test column arrays match the DataFrame results
+        simulator = CBDCSimulator(params)
+        for simulate in (
+            lambda as_dict: simulator.simulate_monetary_transmission(0.01, 6, as_dict=as_dict),
+            lambda as_dict: simulator.simulate_financial_stability(6, as_dict=as_dict)
+        ):
+            results = simulate(False)
+            columns = simulate(True)
+            assert isinstance(columns, dict)
+            assert list(columns) == list(results.columns)
+            for name, values in columns.items():
+                assert isinstance(values, np.ndarray)
+                np.testing.assert_array_equal(values, results[name].to_numpy())
+    
+    def test_cross_border_payments(self, params):
+        # Test batched cross-border payments
+        simulator = CBDCSimulator(params, seed=7)
+        amounts = np.array([1000.0, 50000.0, 250000.0])
+        results = simulator.simulate_cross_border_payments(
+            amounts,
+            ['USD', 'EUR', 'GBP'],
+            'JPY',
+            np.array([150.0, 160.0, 190.0])
+        )
+        assert isinstance(results, pd.DataFrame)
+        assert len(results) == len(amounts)
+        assert results['target_currency'].eq('JPY').all()
+        assert results['fees'].to_numpy() == pytest.approx(amounts * 0.003)
+        assert results['settlement_time'].between(2.0, 2.2).all()
+        
+        with pytest.raises(ValueError):
+            simulator.simulate_cross_border_payments(
+                np.array([1000.0, 2000000.0]), 'USD', 'EUR', 0.9
+            )
+    
+    def test_cross_border_scalar_matches_batch(self, params):
+        # Test the scalar payment matches the batched one under a fixed seed
+        amounts = np.array([1000.0, 50000.0])
+        rates = np.array([0.9, 1.1])
+        batch = CBDCSimulator(params, seed=42).simulate_cross_border_payments(
+            amounts, 'USD', 'EUR', rates
+        )
+        simulator = CBDCSimulator(params, seed=42)
+        for i in range(len(amounts)):
+            payment = simulator.simulate_cross_border_payment(
+                amounts[i], 'USD', 'EUR', rates[i]
+            )
+            assert isinstance(payment['settlement_time'], float)
+            for column in ('settlement_time', 'fees', 'final_amount'):
+                assert payment[column] == pytest.approx(batch[column].iloc[i])
+
+# Test API
+class TestAPI:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls):
+        with TestClient(app) as client:
+            yield client
+    
+    def test_cross_border_draws(self, client):
+        # Test each request draws a fresh network load from the pool workers
+        request = {
+            'amount': 1000,
+            'source_currency': 'USD',
+            'target_currency': 'EUR',
+            'exchange_rate': 0.9
+        }
+        settlement_times = [
+            client.post("/simulation/cross-border", json=request).json()['settlement_time']
+            for _ in range(2)
+        ]
+        assert settlement_times[0] != settlement_times[1]
+    
+    def test_monetary_transmission_cache(self, client):
+        # Test repeated requests hit the event-loop cache and overrides bypass it
+        request = {'policy_rate_change': 0.01, 'simulation_periods': 6}
+        first = client.post("/simulation/monetary-transmission", json=request).json()
+        assert (0.01, 6) in api_main._transmission_cache
+        assert client.post("/simulation/monetary-transmission", json=request).json() == first
+        
+        app.dependency_overrides[api_main.get_simulator] = lambda: CBDCSimulator(
+            CBDCParameters(
+                interest_rate=0.05,
+                reserve_requirement=0.1,
+                transaction_limit=1000000,
+                holding_limit=10000000,
+                privacy_level=0.7,
+                cross_border_enabled=True
+            )
+        )
+        try:
+            overridden = client.post("/simulation/monetary-transmission", json=request).json()
+        finally:
+            app.dependency_overrides.clear()
+        assert overridden['data'][0][1] == pytest.approx(0.05)
+        assert first['data'][0][1] == pytest.approx(0.02)
+    
+    def test_monetary_transmission_cache_budget(self, monkeypatch):
+        # Test the payload cache evicts least recently used bodies over its byte budget
+        monkeypatch.setattr(api_main, '_transmission_cache', OrderedDict())
+        monkeypatch.setattr(api_main, '_transmission_cache_bytes', 0)
+        monkeypatch.setattr(api_main, '_TRANSMISSION_CACHE_BYTES', 10)
+        for periods in range(3):
+            api_main._cache_transmission_payload((0.01, periods), b'0123')
+        assert list(api_main._transmission_cache) == [(0.01, 1), (0.01, 2)]
+        assert api_main._transmission_cache_bytes == 8
+        
+        api_main._cache_transmission_payload((0.02, 1), b'0' * 11)
+        assert (0.02, 1) not in api_main._transmission_cache